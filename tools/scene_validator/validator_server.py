@@ -8,12 +8,10 @@ Typical usage:
     python validator_server.py --port 8080
 """
 
-import os
 import argparse
 import tempfile
 import logging
-from http.server import HTTPServer, BaseHTTPRequestHandler
-import cgi
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 import json
 from scene_validator import SceneValidator
 
@@ -71,27 +69,168 @@ HTML_FORM = """
                 <option value="text">Text</option>
             </select>
         </div>
-        
+
+        <div class="form-group">
+            <label for="fail_fast">
+                <input type="checkbox" name="fail_fast" id="fail_fast" value="1">
+                Stop at first error (pass/fail only)
+            </label>
+        </div>
+
         <input type="submit" value="Validate">
     </form>
 </body>
 </html>
 """
 
+# Encoded once at import; the form never changes, so per-request
+# encoding is wasted work
+HTML_FORM_BYTES = HTML_FORM.encode("utf-8")
+
+
+def _disposition_params(header_block):
+    """Extract the name and filename from a part's Content-Disposition."""
+    name = filename = None
+    for line in header_block.split(b"\r\n"):
+        if line.lower().startswith(b"content-disposition"):
+            for item in line.decode("latin-1").split(";"):
+                item = item.strip()
+                if item.startswith("name="):
+                    name = item[len("name="):].strip('"')
+                elif item.startswith("filename="):
+                    filename = item[len("filename="):].strip('"')
+    return name, filename
+
+
+def _parse_multipart(rfile, headers, file_sink, chunk_size=64 * 1024):
+    """Stream a multipart/form-data body without buffering it whole.
+
+    Reads the request body in chunks and writes the uploaded file part
+    to file_sink as the data arrives, so peak memory stays bounded by
+    the chunk size instead of the upload size. Returns (fields,
+    filename) where fields maps the non-file form fields to their
+    decoded values; filename is None when no file part was present.
+    Replaces the deprecated cgi.FieldStorage, which buffered the whole
+    body in memory before exposing the file.
+    """
+    boundary = None
+    for param in headers.get("Content-Type", "").split(";"):
+        param = param.strip()
+        if param.startswith("boundary="):
+            boundary = param[len("boundary="):].strip('"')
+            break
+    if not boundary:
+        raise ValueError("No multipart boundary in Content-Type")
+
+    remaining = int(headers.get("Content-Length", 0))
+    delimiter = b"\r\n--" + boundary.encode("ascii")
+
+    fields = {}
+    filename = None
+    buffer = bytearray()
+
+    def fill():
+        """Read one more chunk of the body into the buffer."""
+        nonlocal remaining
+        if remaining <= 0:
+            return False
+        chunk = rfile.read(min(chunk_size, remaining))
+        if not chunk:
+            remaining = 0
+            return False
+        remaining -= len(chunk)
+        buffer.extend(chunk)
+        return True
+
+    def fill_until(token):
+        """Grow the buffer until token appears; return its index or -1."""
+        while True:
+            index = buffer.find(token)
+            if index != -1:
+                return index
+            if not fill():
+                return -1
+
+    # The body opens with --boundary; seeding the buffer with \r\n lets
+    # the opening line match the same delimiter as every later one
+    buffer.extend(b"\r\n")
+    if fill_until(delimiter) != 0:
+        raise ValueError("Malformed multipart body")
+    del buffer[:len(delimiter)]
+
+    while True:
+        # After a delimiter: "--" closes the body, \r\n opens a part
+        while len(buffer) < 2 and fill():
+            pass
+        if len(buffer) < 2 or buffer[:2] == b"--":
+            break
+        del buffer[:2]
+
+        header_end = fill_until(b"\r\n\r\n")
+        if header_end == -1:
+            raise ValueError("Malformed multipart part headers")
+        name, part_filename = _disposition_params(bytes(buffer[:header_end]))
+        del buffer[:header_end + 4]
+
+        # Only the first file part is streamed to the sink; extra file
+        # parts are drained, plain fields are accumulated in memory
+        is_file = part_filename is not None and filename is None
+        if is_file:
+            filename = part_filename
+        value_parts = []
+
+        # Keep a delimiter-sized tail in the buffer so a delimiter
+        # split across two reads is never missed
+        while True:
+            index = buffer.find(delimiter)
+            if index != -1:
+                data = bytes(buffer[:index])
+                del buffer[:index + len(delimiter)]
+            else:
+                keep = len(delimiter) - 1
+                if len(buffer) > keep:
+                    data = bytes(buffer[:-keep])
+                    del buffer[:-keep]
+                else:
+                    data = b""
+            if is_file:
+                file_sink.write(data)
+            elif part_filename is None:
+                value_parts.append(data)
+            if index != -1:
+                break
+            if not fill():
+                raise ValueError("Truncated multipart body")
+
+        if part_filename is None and name:
+            fields[name] = b"".join(value_parts).decode("utf-8", "replace")
+
+    return fields, filename
+
 class ValidatorHandler(BaseHTTPRequestHandler):
     """HTTP request handler for validator server."""
     
-    def __init__(self, *args, **kwargs):
-        self.validator = SceneValidator(DEFAULT_CONFIG)
+    def __init__(self, validator, *args, **kwargs):
+        self.validator = validator
         super().__init__(*args, **kwargs)
         
+    def _send_body(self, status, content_type, body):
+        """Send a fully buffered response body in a single write.
+
+        Sending Content-Length and writing the body at once keeps the
+        syscall count constant for large reports and lets clients reuse
+        the connection.
+        """
+        self.send_response(status)
+        self.send_header("Content-type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
     def do_GET(self):
         """Handle GET requests."""
         if self.path == "/":
-            self.send_response(200)
-            self.send_header("Content-type", "text/html")
-            self.end_headers()
-            self.wfile.write(HTML_FORM.encode())
+            self._send_body(200, "text/html", HTML_FORM_BYTES)
         else:
             self.send_error(404, "File not found")
             
@@ -99,51 +238,39 @@ class ValidatorHandler(BaseHTTPRequestHandler):
         """Handle POST requests."""
         if self.path == "/upload":
             try:
-                form = cgi.FieldStorage(
-                    fp=self.rfile,
-                    headers=self.headers,
-                    environ={'REQUEST_METHOD': 'POST'}
-                )
-                
-                # Get the uploaded file
-                fileitem = form['file']
-                
-                if not fileitem.file:
-                    self.send_error(400, "No file was uploaded")
-                    return
-                    
-                # Get the output format
-                output_format = form.getvalue("format", "html")
-                
-                # Save the file to a temporary location
-                with tempfile.NamedTemporaryFile(delete=False) as tmp:
-                    tmp.write(fileitem.file.read())
-                    tmp_path = tmp.name
-                    
-                # Validate the file
-                logger.info(f"Validating uploaded file: {fileitem.filename}")
-                result = self.validator.validate(tmp_path)
-                
-                # Remove the temporary file
-                os.unlink(tmp_path)
-                
-                # Generate response based on format
+                # Spool the upload: small files stay in memory, larger
+                # ones spill to disk past the threshold. The multipart
+                # parser streams the file part into the spool as chunks
+                # arrive, so the body is never buffered whole
+                with tempfile.SpooledTemporaryFile(max_size=16 << 20) as tmp:
+                    fields, filename = _parse_multipart(self.rfile, self.headers, tmp)
+
+                    if filename is None:
+                        self.send_error(400, "No file was uploaded")
+                        return
+
+                    # Get the output format and fail-fast flag
+                    output_format = fields.get("format", "html")
+                    fail_fast = "fail_fast" in fields
+
+                    logger.info(f"Validating uploaded file: {filename}")
+                    tmp.seek(0)
+                    result = self.validator.validate_stream(
+                        tmp, filename, fail_fast=fail_fast
+                    )
+
+                # Buffer the full response so it goes out as one write
+                # with an accurate Content-Length
                 if output_format == "json":
-                    self.send_response(200)
-                    self.send_header("Content-type", "application/json")
-                    self.end_headers()
-                    self.wfile.write(result.to_json().encode())
+                    body, content_type = result.to_json_bytes(), "application/json"
                 elif output_format == "text":
-                    self.send_response(200)
-                    self.send_header("Content-type", "text/plain")
-                    self.end_headers()
-                    self.wfile.write(result.summary().encode())
+                    body, content_type = result.summary().encode("utf-8"), "text/plain"
                 else:  # html
-                    self.send_response(200)
-                    self.send_header("Content-type", "text/html")
-                    self.end_headers()
-                    self.wfile.write(result.to_html().encode())
-                    
+                    body, content_type = result.to_html().encode("utf-8"), "text/html"
+
+                self._send_body(200, content_type, body)
+
+
             except Exception as e:
                 logger.exception("Error processing upload")
                 self.send_error(500, f"Internal server error: {str(e)}")
@@ -153,8 +280,18 @@ class ValidatorHandler(BaseHTTPRequestHandler):
 
 def run_server(port=8080):
     """Run the validator web server."""
+    # BaseHTTPRequestHandler is instantiated per connection, so build the
+    # validator once here and hand the same instance to every handler.
+    validator = SceneValidator(DEFAULT_CONFIG)
+
+    def handler_factory(*args, **kwargs):
+        return ValidatorHandler(validator, *args, **kwargs)
+
+    # ThreadingHTTPServer handles each request on its own thread, so one
+    # slow upload or validation no longer blocks every other client. The
+    # shared validator's config dict is only ever read after construction.
     server_address = ('', port)
-    httpd = HTTPServer(server_address, ValidatorHandler)
+    httpd = ThreadingHTTPServer(server_address, handler_factory)
     logger.info(f"Starting validator server on port {port}")
     print(f"Server running at http://localhost:{port}/")
     httpd.serve_forever()